@@ -3,8 +3,8 @@
 import csv
 import random
 import json
-import zipfile
-import xml.etree.ElementTree as ET
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 # Configuration
@@ -13,36 +13,48 @@ OUTPUT_FILE = 'dialogues/patient_profiles_1500.csv'
 FITZPATRICK_FILE = 'datasets/Fitzpatrick17k/fitzpatrick17k.csv'
 HAM_FILE = 'datasets/HAM10000/metadata/HAM10000_metadata.csv'
 MEDICAL_KNOWLEDGE_FILE = 'datasets/Medical_Knowledge/All Diseases Data.xlsx'
+RANDOM_SEED = 42  # Fixed so repeated runs produce the same profiles
 
+# One seeded generator for every profile draw, independent of the global random state
+rng = random.Random(RANDOM_SEED)
+
+
+# SpreadsheetML element tags (namespace-qualified, as ElementTree reports them)
+XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+XLSX_SI, XLSX_T = XLSX_NS + 'si', XLSX_NS + 't'
+XLSX_ROW, XLSX_C, XLSX_V = XLSX_NS + 'row', XLSX_NS + 'c', XLSX_NS + 'v'
 
 def parse_xlsx_standard_library(xlsx_path):
     """Parse XLSX file using zipfile and xml.etree."""
+    # Imported here so runs without the workbook don't pay for them
+    import zipfile
+    import xml.etree.ElementTree as ET
+
     with zipfile.ZipFile(xlsx_path, 'r') as zip_ref:
-        # Read shared strings (for text values)
+        # Read shared strings (for text values), streaming one <si> at a time
         shared_strings = []
         try:
             with zip_ref.open('xl/sharedStrings.xml') as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
-                ns = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-                # Extract all text elements
-                for si in root.findall('.//main:si', ns):
-                    texts = [t.text for t in si.findall('.//main:t', ns) if t.text]
+                for _, si in ET.iterparse(f):
+                    if si.tag != XLSX_SI:
+                        continue
+                    # Join all text runs in the item
+                    texts = [t.text for t in si.iter(XLSX_T) if t.text]
                     shared_strings.append(''.join(texts))
+                    si.clear()
         except KeyError:
             pass  # No shared strings in this file
 
-        # Read the first worksheet
+        # Read the first worksheet, streaming it row by row and clearing each
+        # row once its cells are extracted (the full sheet is never held as a tree)
+        rows = []
         with zip_ref.open('xl/worksheets/sheet1.xml') as f:
-            tree = ET.parse(f)
-            root = tree.getroot()
-            ns = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-
-            rows = []
-            for row_elem in root.findall('.//main:row', ns):
+            for _, row_elem in ET.iterparse(f):
+                if row_elem.tag != XLSX_ROW:
+                    continue
                 cells = []
-                for cell in row_elem.findall('.//main:c', ns):
-                    v = cell.find('main:v', ns)
+                for cell in row_elem.iter(XLSX_C):
+                    v = cell.find(XLSX_V)
                     t = cell.get('t')
 
                     if v is not None:
@@ -54,10 +66,22 @@ def parse_xlsx_standard_library(xlsx_path):
                         cells.append('')
 
                 rows.append(cells)
+                row_elem.clear()
 
-            return rows
+        return rows
 
 
+# Treatment keywords that map straight to a label ('topical' and 'oral' are
+# handled in load_medical_knowledge_data, where 'oral' depends on the drug named)
+TREATMENT_KEYWORD_LABELS = [
+    ('retinoid', 'Topical retinoids'),
+    ('phototherapy', 'Phototherapy'),
+    ('laser', 'Laser therapy'),
+    ('excision', 'Surgical excision'),
+    ('surgery', 'Surgical excision'),
+    ('cryotherapy', 'Cryotherapy'),
+]
+
 def load_medical_knowledge_data():
     """Load conditions and treatments from All Diseases Data.xlsx."""
     try:
@@ -83,41 +107,20 @@ def load_medical_knowledge_data():
             normalized = condition_name.strip().title()
             conditions.append(normalized)
 
-            # Extract treatment keywords from treatment text
-            # Look for common treatment patterns
-            treatment_list = []
-
-            # Common treatment patterns to extract
-            treatment_keywords = [
-                'topical', 'oral', 'systemic', 'corticosteroid', 'retinoid',
-                'antibiotic', 'antifungal', 'steroid', 'phototherapy', 'laser',
-                'immunosuppressant', 'biologic', 'excision', 'surgery', 'cryotherapy'
-            ]
-
+            # Map treatment keywords in the text to treatment labels, keeping
+            # first-seen order without duplicates
             treatment_lower = treatment_text.lower()
-            for keyword in treatment_keywords:
-                if keyword in treatment_lower:
-                    # Extract phrase containing keyword
-                    if 'topical' in keyword and 'topical' in treatment_lower:
-                        treatment_list.append('Topical corticosteroids')
-                    elif 'oral' in keyword and 'oral' in treatment_lower:
-                        if 'antibiotic' in treatment_lower:
-                            treatment_list.append('Oral antibiotics')
-                        elif 'corticosteroid' in treatment_lower or 'prednisone' in treatment_lower:
-                            treatment_list.append('Oral corticosteroids')
-                    elif 'retinoid' in keyword and 'retinoid' in treatment_lower:
-                        treatment_list.append('Topical retinoids')
-                    elif 'phototherapy' in keyword:
-                        treatment_list.append('Phototherapy')
-                    elif 'laser' in keyword:
-                        treatment_list.append('Laser therapy')
-                    elif 'excision' in keyword or 'surgery' in keyword:
-                        treatment_list.append('Surgical excision')
-                    elif 'cryotherapy' in keyword:
-                        treatment_list.append('Cryotherapy')
-
-            # Remove duplicates
-            treatment_list = list(set(treatment_list))
+            treatment_list = []
+            if 'topical' in treatment_lower:
+                treatment_list.append('Topical corticosteroids')
+            if 'oral' in treatment_lower:
+                if 'antibiotic' in treatment_lower:
+                    treatment_list.append('Oral antibiotics')
+                elif 'corticosteroid' in treatment_lower or 'prednisone' in treatment_lower:
+                    treatment_list.append('Oral corticosteroids')
+            for keyword, label in TREATMENT_KEYWORD_LABELS:
+                if keyword in treatment_lower and label not in treatment_list:
+                    treatment_list.append(label)
 
             if treatment_list:
                 treatments[normalized.lower()] = treatment_list
@@ -151,19 +154,19 @@ NAMES = {
     'Germany': ['Lukas', 'Emma', 'Leon', 'Mia', 'Finn', 'Hannah', 'Jonas', 'Sophia'],
 }
 
-SURNAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Martinez', 'Rodriguez',
+SURNAMES = ('Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Martinez', 'Rodriguez',
             'Lee', 'Kim', 'Park', 'Chen', 'Wang', 'Singh', 'Patel', 'Rahman', 'Ahmed',
             'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson',
-            'Okoye', 'Nwankwo', 'Santos', 'Silva', 'Petrova', 'Ivanov', 'Mueller', 'Schmidt']
+            'Okoye', 'Nwankwo', 'Santos', 'Silva', 'Petrova', 'Ivanov', 'Mueller', 'Schmidt')
 
-REGIONS = list(NAMES.keys())
+REGIONS = tuple(NAMES)
 
 # Top conditions from Fitzpatrick17k (based on actual frequencies)
-TOP_CONDITIONS = [
+TOP_CONDITIONS = (
     'Psoriasis', 'Acne', 'Eczema', 'Contact Dermatitis', 'Rosacea',
     'Melasma', 'Seborrheic Dermatitis', 'Sun Damage', 'Hyperpigmentation',
     'Folliculitis', 'Lupus', 'Dermatitis', 'Lichen Planus', 'Vitiligo'
-]
+)
 
 # Map conditions to realistic treatments based on clinical guidelines
 CONDITION_TREATMENTS = {
@@ -177,51 +180,80 @@ CONDITION_TREATMENTS = {
 }
 
 # Common allergies
-ALLERGIES = ['None', 'Fragrance mix', 'Nickel', 'Latex', 'Dust mites', 'Pollen',
-             'Preservatives', 'Lanolin', 'Propylene glycol']
+ALLERGIES = ('None', 'Fragrance mix', 'Nickel', 'Latex', 'Dust mites', 'Pollen',
+             'Preservatives', 'Lanolin', 'Propylene glycol')
 
 # Drug sensitivities
-SENSITIVITIES = ['None', 'Retinoids cause dryness', 'AHAs sting', 'Benzoyl peroxide irritates',
-                 'Alcohol-based toners sting', 'Propylene glycol stings']
+SENSITIVITIES = ('None', 'Retinoids cause dryness', 'AHAs sting', 'Benzoyl peroxide irritates',
+                 'Alcohol-based toners sting', 'Propylene glycol stings')
 
 # Skin types
-SKIN_TYPES = ['Dry', 'Oily', 'Combination', 'Sensitive', 'Normal']
+SKIN_TYPES = ('Dry', 'Oily', 'Combination', 'Sensitive', 'Normal')
 
 # Adverse reactions
-ADVERSE_REACTIONS = ['None', 'Mild irritation week 1', 'Peeling when overused',
-                     'Transient dryness', 'Dryness after use', 'Redness initially']
+ADVERSE_REACTIONS = ('None', 'Mild irritation week 1', 'Peeling when overused',
+                     'Transient dryness', 'Dryness after use', 'Redness initially')
 
 # Routines
-ROUTINES = ['Minimal routine', 'Double cleanse at night', 'SPF reapplication mid-day',
+ROUTINES = ('Minimal routine', 'Double cleanse at night', 'SPF reapplication mid-day',
             'Moisturizer after bath', 'Barrier-repair moisturizer focus',
-            'Mineral sunscreen; avoid triggers', 'Gentle cleansing routine']
+            'Mineral sunscreen; avoid triggers', 'Gentle cleansing routine')
 
 # Environments
-ENVIRONMENTS = ['Urban pollution', 'Dry climate', 'Humid summers', 'Cold winters',
-                'High UV in summer', 'Tropical sun', 'Arid, high UV', 'Mild winters']
+ENVIRONMENTS = ('Urban pollution', 'Dry climate', 'Humid summers', 'Cold winters',
+                'High UV in summer', 'Tropical sun', 'Arid, high UV', 'Mild winters')
 
 # Habits (age/gender appropriate assignments)
-HABITS_GENERAL = ['Touches face during sports', 'Long hot showers', 'Outdoor sports',
+HABITS_GENERAL = ('Touches face during sports', 'Long hot showers', 'Outdoor sports',
                   'Daily cycling outdoors', 'Swimming regularly', 'Tennis mid-morning',
-                  'Hot showers', 'Helmet use for cycling', 'Hair oiling weekly', 'Spicy foods']
+                  'Hot showers', 'Helmet use for cycling', 'Hair oiling weekly', 'Spicy foods')
+
+HABITS_MALE = ('Beard grooming with oils', 'Shaving daily', 'Frequent gym use')
 
-HABITS_MALE = ['Beard grooming with oils', 'Shaving daily', 'Frequent gym use']
+# Habit pool for males 16+ (general plus male-specific), built once
+HABITS_MALE_ALL = HABITS_GENERAL + HABITS_MALE
+
+# Pregnancy draw for females of childbearing age (10% pregnant)
+PREGNANCY_OPTIONS = ('Not Pregnant',) * 9 + ('Pregnant',)
+
+def parse_age_sex(age_str, sex_str):
+    """Return (age, sex) for a usable HAM10000 age/sex pair, else None."""
+    if not age_str or not sex_str:
+        return None
+    try:
+        age = int(float(age_str))
+    except (ValueError, OverflowError):
+        return None
+    sex = sex_str.strip().capitalize()
+    if sex in ('Male', 'Female') and 10 <= age <= 95:
+        return (age, sex)
+    return None
 
 def load_ham_demographics():
     """Load age/sex from HAM10000 dataset"""
     demographics = []
     try:
-        with open(HAM_FILE, 'r') as f:
-            reader = csv.DictReader(f)
+        with open(HAM_FILE, 'r', buffering=1 << 20) as f:
+            # Plain rows indexed by column position (no per-row dict)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'age' not in header or 'sex' not in header:
+                return None
+            age_index = header.index('age')
+            sex_index = header.index('sex')
+            min_length = max(age_index, sex_index) + 1
+            # Rows repeat a small set of age/sex values, so each distinct pair
+            # is parsed and validated once and its tuple reused
+            parsed = {}
             for row in reader:
-                if row.get('age') and row.get('sex'):
-                    try:
-                        age = int(float(row['age']))
-                        sex = row['sex'].strip().capitalize()
-                        if sex in ['Male', 'Female'] and 10 <= age <= 95:
-                            demographics.append((age, sex))
-                    except:
-                        pass
+                if len(row) < min_length:
+                    continue
+                pair = (row[age_index], row[sex_index])
+                if pair not in parsed:
+                    parsed[pair] = parse_age_sex(*pair)
+                demographic = parsed[pair]
+                if demographic:
+                    demographics.append(demographic)
     except FileNotFoundError:
         print("  ⚠️  HAM10000 file not found, using random demographics")
     return demographics if demographics else None
@@ -229,16 +261,24 @@ def load_ham_demographics():
 def get_age_sex(ham_demographics):
     """Get realistic age/sex"""
     if ham_demographics:
-        age, sex = random.choice(ham_demographics)
+        age, sex = rng.choice(ham_demographics)
         # Adjust age distribution (HAM skews older)
-        if random.random() < 0.3:  # 30% younger patients
-            age = random.randint(14, 35)
+        if rng.random() < 0.3:  # 30% younger patients
+            age = rng.randint(14, 35)
         return age, sex
     else:
-        age = random.randint(14, 75)
-        sex = random.choice(['Male', 'Female'])
+        age = rng.randint(14, 75)
+        sex = rng.choice(['Male', 'Female'])
         return age, sex
 
+@lru_cache(maxsize=None)
+def find_treatment_key(condition_lower):
+    """Return the first CONDITION_TREATMENTS key contained in the condition name (cached per name)."""
+    for key in CONDITION_TREATMENTS:
+        if key in condition_lower:
+            return key
+    return None
+
 def get_treatments_for_condition(condition, extended_treatments=None):
     """Get treatments for condition from hardcoded list or extended data."""
     condition_lower = condition.lower()
@@ -246,77 +286,76 @@ def get_treatments_for_condition(condition, extended_treatments=None):
     # First check extended treatments from medical knowledge base
     if extended_treatments and condition_lower in extended_treatments:
         treatments = extended_treatments[condition_lower]
-        num_treatments = random.randint(1, min(3, len(treatments)))
-        selected = random.sample(treatments, num_treatments)
+        num_treatments = rng.randint(1, min(3, len(treatments)))
+        selected = rng.sample(treatments, num_treatments)
         return ', '.join(selected)
 
-    # Fall back to hardcoded treatments
-    for key in CONDITION_TREATMENTS:
-        if key in condition_lower:
-            num_treatments = random.randint(1, 3)
-            treatments = CONDITION_TREATMENTS[key]
-            selected = random.sample(treatments, min(num_treatments, len(treatments)))
-            return ', '.join(selected)
+    # Fall back to hardcoded treatments (substring match, resolved once per
+    # distinct condition name)
+    key = find_treatment_key(condition_lower)
+    if key:
+        num_treatments = rng.randint(1, 3)
+        treatments = CONDITION_TREATMENTS[key]
+        selected = rng.sample(treatments, min(num_treatments, len(treatments)))
+        return ', '.join(selected)
 
     return 'Topical treatments'
 
-def generate_profile(profile_id, ham_demographics, extended_conditions=None, extended_treatments=None):
-    """Generate one patient profile."""
+# Option lists for the profile fields that don't depend on anything else,
+# in the order generate_profile unpacks them
+INDEPENDENT_FIELD_OPTIONS = (REGIONS, SURNAMES, SKIN_TYPES, ALLERGIES, SENSITIVITIES,
+                             ADVERSE_REACTIONS, ROUTINES, ENVIRONMENTS)
+
+def draw_independent_fields(count):
+    """Draw the independent fields for `count` profiles, one rng.choices call per field."""
+    return list(zip(*(rng.choices(options, k=count) for options in INDEPENDENT_FIELD_OPTIONS)))
+
+def build_condition_options(extended_conditions=None):
+    """Merge hardcoded and extended conditions (deduped, order kept) and map each to its secondary options."""
+    all_conditions = list(dict.fromkeys([*TOP_CONDITIONS, *(extended_conditions or ())]))
+    secondary_options = {c: [x for x in all_conditions if x != c] for c in all_conditions}
+    return all_conditions, secondary_options
+
+def generate_profile(profile_id, ham_demographics, independent_fields, all_conditions,
+                     secondary_options, extended_treatments=None):
+    """Generate one patient profile (independent fields come pre-drawn from draw_independent_fields)."""
+
+    (region, surname, skin_type, allergies, drug_sensitivities,
+     adverse_reactions, routine, environment) = independent_fields
 
     age, sex = get_age_sex(ham_demographics)
 
-    # Region and name
-    region = random.choice(REGIONS)
-    first_name = random.choice(NAMES[region])
-    surname = random.choice(SURNAMES)
+    # Name from the region's name list
+    first_name = rng.choice(NAMES[region])
     name = f"{first_name} {surname}"
 
     # Pregnancy status (only for females of childbearing age)
     if sex == 'Female' and 14 <= age <= 50:
-        pregnancy_status = random.choice(['Not Pregnant'] * 9 + ['Pregnant'])  # 10% pregnant
+        pregnancy_status = rng.choice(PREGNANCY_OPTIONS)  # 10% pregnant
     else:
         pregnancy_status = 'N/A'
 
-    # Skin type and conditions
-    skin_type = random.choice(SKIN_TYPES)
-
-    # Combine hardcoded and extended conditions
-    all_conditions = TOP_CONDITIONS.copy()
-    if extended_conditions:
-        # Add unique extended conditions (avoid duplicates)
-        for cond in extended_conditions:
-            if cond not in all_conditions:
-                all_conditions.append(cond)
-
-    primary_concern = random.choice(all_conditions)
+    # Conditions: hardcoded and extended, merged once by build_condition_options
+    primary_concern = rng.choice(all_conditions)
 
     # Secondary concern (different from primary)
-    available_conditions = [c for c in all_conditions if c != primary_concern]
-    secondary_concern = random.choice(available_conditions) if available_conditions else 'None'
-
-    # Allergies and sensitivities
-    allergies = random.choice(ALLERGIES)
-    drug_sensitivities = random.choice(SENSITIVITIES)
+    available_conditions = secondary_options[primary_concern]
+    secondary_concern = rng.choice(available_conditions) if available_conditions else 'None'
 
     # Treatments based on condition (with extended treatments)
     past_treatments = get_treatments_for_condition(primary_concern, extended_treatments)
 
-    # Other attributes
-    adverse_reactions = random.choice(ADVERSE_REACTIONS)
-    routine = random.choice(ROUTINES)
-    environment = random.choice(ENVIRONMENTS)
-
     # Gender/age appropriate habits
     if sex == 'Male' and age >= 16:
-        habits = random.choice(HABITS_GENERAL + HABITS_MALE)
+        habits = rng.choice(HABITS_MALE_ALL)
     else:
-        habits = random.choice(HABITS_GENERAL)
+        habits = rng.choice(HABITS_GENERAL)
 
-    return [
+    return (
         profile_id, name, age, sex, pregnancy_status, region, skin_type,
         primary_concern, secondary_concern, allergies, drug_sensitivities,
         past_treatments, adverse_reactions, routine, environment, habits
-    ]
+    )
 
 def main():
     print("=" * 60)
@@ -334,30 +373,45 @@ def main():
     # Load medical knowledge data
     print("\nLoading medical knowledge from All Diseases Data.xlsx...")
     extended_conditions, extended_treatments = load_medical_knowledge_data()
+    all_conditions, secondary_options = build_condition_options(extended_conditions)
 
     print(f"\n📊 Total available conditions: "
           f"{len(TOP_CONDITIONS)} (hardcoded) + {len(extended_conditions)} (extended) = "
-          f"{len(set(TOP_CONDITIONS + extended_conditions))} unique")
+          f"{len(all_conditions)} unique")
 
     print(f"\nGenerating {NUM_PROFILES} realistic profiles...\n")
 
-    # Generate profiles
-    profiles = []
-    for i in range(1, NUM_PROFILES + 1):
-        profile = generate_profile(i, ham_demographics, extended_conditions, extended_treatments)
-        profiles.append(profile)
-        if i % 10 == 0:
-            print(f"  ✓ Generated {i}/{NUM_PROFILES} profiles")
-
-    # Save to CSV
     headers = ['id', 'name', 'age', 'sex', 'pregnancy_status', 'region', 'skin_type',
                'primary_concern', 'secondary_concern', 'allergies', 'drug_sensitivities',
                'past_treatments', 'adverse_reactions', 'routine', 'environment', 'habits']
 
-    with open(OUTPUT_FILE, 'w', newline='') as f:
+    # Generate profiles, writing each row as it's made and keeping running
+    # statistics instead of holding every profile in memory
+    age_sum = 0
+    age_min = age_max = None
+    sexes = Counter()
+    conditions = Counter()
+    field_draws = draw_independent_fields(NUM_PROFILES)
+    progress_every = max(NUM_PROFILES // 20, 1)  # report progress about every 5%
+    with open(OUTPUT_FILE, 'w', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(headers)
-        writer.writerows(profiles)
+        for i in range(1, NUM_PROFILES + 1):
+            profile = generate_profile(i, ham_demographics, field_draws[i - 1],
+                                       all_conditions, secondary_options, extended_treatments)
+            writer.writerow(profile)
+
+            age = profile[2]
+            age_sum += age
+            if age_min is None or age < age_min:
+                age_min = age
+            if age_max is None or age > age_max:
+                age_max = age
+            sexes[profile[3]] += 1
+            conditions[profile[7]] += 1
+
+            if i % progress_every == 0:
+                print(f"  ✓ Generated {i}/{NUM_PROFILES} profiles")
 
     print(f"\n✅ SUCCESS! Saved {NUM_PROFILES} profiles to {OUTPUT_FILE}")
 
@@ -366,27 +420,17 @@ def main():
     print("PROFILE STATISTICS")
     print("=" * 60)
 
-    ages = [p[2] for p in profiles]
     print(f"\nAge distribution:")
-    print(f"  • Min: {min(ages)}")
-    print(f"  • Max: {max(ages)}")
-    print(f"  • Mean: {sum(ages)/len(ages):.1f}")
-
-    sexes = {}
-    for p in profiles:
-        sex = p[3]
-        sexes[sex] = sexes.get(sex, 0) + 1
+    print(f"  • Min: {age_min}")
+    print(f"  • Max: {age_max}")
+    print(f"  • Mean: {age_sum/NUM_PROFILES:.1f}")
+
     print(f"\nSex distribution:")
     for sex, count in sexes.items():
         print(f"  • {sex}: {count}")
 
-    conditions = {}
-    for p in profiles:
-        condition = p[7]
-        conditions[condition] = conditions.get(condition, 0) + 1
     print(f"\nTop 10 conditions:")
-    sorted_conditions = sorted(conditions.items(), key=lambda x: x[1], reverse=True)[:10]
-    for condition, count in sorted_conditions:
+    for condition, count in conditions.most_common(10):
         print(f"  • {condition}: {count}")
 
     print("\n" + "=" * 60)
@@ -8,6 +8,11 @@ from pathlib import Path
 from datetime import datetime
 import requests
 
+try:
+    import orjson  # Optional: parses large results files several times faster
+except ImportError:
+    orjson = None
+
 
 class GeminiScorer:
     """LLM-as-judge scorer using Gemini"""
@@ -57,6 +62,10 @@ class GeminiScorer:
         # Parse repair: retry with simpler JSON-only prompt when parsing fails
         self.parse_repair_enabled = os.getenv('GEMINI_PARSE_REPAIR', 'true').lower() in ('true', '1', 'yes')
 
+        # One pooled session for every API call, so the TCP/TLS connection is
+        # kept alive between requests instead of reopened for each dialogue
+        self.session = requests.Session()
+
     def score_dialogue(self, dialogue_data: dict) -> dict:
         """Score a complete dialogue on all 4 dimensions"""
 
@@ -364,7 +373,7 @@ Output JSON now:"""
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'https://generativelanguage.googleapis.com/v1beta/{self.model}:generateContent',
                 headers={'Content-Type': 'application/json'},
                 params={'key': self.api_key},
@@ -419,7 +428,7 @@ Output JSON now:"""
         while True:
             payload['generationConfig']['maxOutputTokens'] = current_max_tokens
             try:
-                response = requests.post(
+                response = self.session.post(
                     (
                         "https://generativelanguage.googleapis.com/"
                         f"v1/models/{self.model}:generateContent?key={self.api_key}"
@@ -784,15 +793,23 @@ def auto_score_results(results_file: Path, retry_failed_only: bool = False):
     print("=" * 70)
 
     # Load results
-    with open(results_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(Path(results_file).read_bytes())
+    else:
+        with open(results_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     results = data['results']
     metadata = data['metadata']
 
     # Filter out failed/incomplete dialogues
-    complete_dialogues = [r for r in results if is_dialogue_complete(r)]
-    failed_dialogues = [r for r in results if not is_dialogue_complete(r)]
+    complete_dialogues = []
+    failed_dialogues = []
+    for r in results:
+        if is_dialogue_complete(r):
+            complete_dialogues.append(r)
+        else:
+            failed_dialogues.append(r)
 
     if failed_dialogues:
         print(f"⚠️  Skipping {len(failed_dialogues)} failed/incomplete dialogues (API errors or timeouts)")
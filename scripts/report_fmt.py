@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Row and text formatting helpers for the files written by create_scoring_sheet.py.
+
+Kept in a separate, fully annotated module so it can optionally be compiled
+for speed on large result sets (the scripts import it unchanged either way):
+
+    pip install mypy
+    mypyc scripts/report_fmt.py
+"""
+
+from typing import Any, Callable, Dict
+
+Append = Callable[[str], Any]
+
+# Horizontal rules, built once instead of on every dialogue/turn
+EQ80 = "=" * 80 + "\n"
+DASH80 = "-" * 80 + "\n"
+
+
+def format_dialogue_header(append: Append, label: str, index: int, count: int,
+                           result: Dict[str, Any]) -> None:
+    """Render the banner and patient details that open each dialogue"""
+    append("\n")
+    append(EQ80)
+    append(f"{label} {index}/{count}: {result['dialogue_id']}\n")
+    append(EQ80)
+    append(f"Patient: {result['patient_name']} (ID: {result['patient_id']})\n")
+    append(f"Has Misinformation: {result['has_misinformation']}\n")
+    append(f"Timestamp: {result['timestamp']}\n")
+
+
+def format_exchange(append: Append, exchange: Dict[str, Any]) -> None:
+    """Render one conversation turn (shared by the flagged and full review docs)"""
+    ai_response = exchange.get('ai_response')
+    tests = exchange.get('tests')
+    expected_recall = exchange.get('expected_recall')
+    misinformation = exchange.get('misinformation')
+    expected_behaviors = exchange.get('expected_behaviors')
+
+    append(f"\n[TURN {exchange['turn']}]\n\n")
+
+    append(f"USER:\n{exchange['user_message']}\n\n")
+
+    if ai_response:
+        append(f"AI RESPONSE:\n{ai_response}\n\n")
+    else:
+        append(f"ERROR: {exchange.get('error', 'Unknown error')}\n\n")
+
+    # Add test info
+    if tests:
+        append(f"TESTS: {', '.join(tests)}\n")
+
+    if expected_recall:
+        append(f"EXPECTED RECALL: {expected_recall}\n")
+
+    if misinformation:
+        append(f"MISINFORMATION CLAIM: {misinformation['claim']}\n")
+        append(f"SEVERITY: {misinformation['severity']}\n")
+
+    if expected_behaviors:
+        append(f"\nEXPECTED BEHAVIORS:\n")
+        for behavior in expected_behaviors:
+            append(f"  - {behavior}\n")
+
+    append("\n")
+    append(DASH80)
+
+
+def scoring_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only what the scoring sheet needs from a dialogue (no conversation text)"""
+    return {
+        'dialogue_id': result['dialogue_id'],
+        'patient_name': result['patient_name'],
+        'patient_id': result['patient_id'],
+        'has_misinformation': result['has_misinformation'],
+        'exchange_count': len(result['exchanges']),
+        'auto_scores': result.get('auto_scores'),
+    }
+
@@ -6,6 +6,8 @@ Run dermatology benchmark with Gemini API (google-genai v1.50.1)
 import os
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
@@ -15,6 +17,28 @@ from google.genai import types
 
 Message = Dict[str, str]
 
+# Dialogues run at once (turns within a dialogue stay in order) and the
+# minimum spacing between API calls across all of them
+MAX_CONCURRENT_DIALOGUES = max(1, int(os.getenv("BENCHMARK_CONCURRENCY", "1")))
+REQUEST_INTERVAL = float(os.getenv("BENCHMARK_REQUEST_INTERVAL", "2.0"))
+
+
+class RequestPacer:
+    """Space API call starts at least `interval` seconds apart, shared by all threads"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class GeminiFreeClient:
     """Gemini client using google-genai v1.50.1"""
@@ -150,7 +174,7 @@ def load_dialogues(filepath: str = "dialogues/dialogue_templates.jsonl") -> list
     return dialogues
 
 
-def run_dialogue(client: GeminiFreeClient, dialogue: dict) -> dict:
+def run_dialogue(client: GeminiFreeClient, dialogue: dict, pacer: RequestPacer, label: str = "") -> dict:
     system_prompt = (
         "You are a helpful dermatology assistant. Provide brief, accurate medical information. "
         "Remember all patient details shared. Correct misinformation politely. Include disclaimers."
@@ -173,11 +197,12 @@ def run_dialogue(client: GeminiFreeClient, dialogue: dict) -> dict:
         turn_num = user_turn["turn"]
         conversation.append({"role": "user", "content": user_turn["content"]})
 
-        print(f"  Turn {turn_num}: ", end="", flush=True)
+        pacer.wait()
         ai_response = client.chat(conversation)
 
+        # One complete line per turn so concurrent dialogues don't interleave mid-line
         if ai_response["success"] and ai_response["response"] is not None:
-            print(f"✅ ({len(ai_response['response'])} chars)")
+            print(f"{label}  Turn {turn_num}: ✅ ({len(ai_response['response'])} chars)")
             conversation.append({"role": "assistant", "content": ai_response["response"]})
             result["exchanges"].append({
                 "turn": turn_num,
@@ -190,7 +215,7 @@ def run_dialogue(client: GeminiFreeClient, dialogue: dict) -> dict:
                 })
 
         else:
-            print(f"❌ Error: {ai_response.get('error', 'Unknown error')}")
+            print(f"{label}  Turn {turn_num}: ❌ Error: {ai_response.get('error', 'Unknown error')}")
             result["exchanges"].append({
                 "turn": turn_num,
                 "user_message": user_turn["content"],
@@ -199,8 +224,6 @@ def run_dialogue(client: GeminiFreeClient, dialogue: dict) -> dict:
                 })
             break
 
-        time.sleep(2)
-
     return result
 
 
@@ -224,44 +247,55 @@ def run_benchmark(num_dialogues: int = 1500, save_checkpoint_every: int = 100):
 
     dialogues = dialogues[:num_dialogues]
 
-    estimated_time_minutes = (len(dialogues) * 5 * 2) / 60
+    estimated_time_minutes = (len(dialogues) * 5 * REQUEST_INTERVAL) / 60
     print(f"\n⏱️  Estimated time: {estimated_time_minutes:.0f} minutes ({estimated_time_minutes/60:.1f} hours)")
     print(f"💾 Checkpoints saved every {save_checkpoint_every} dialogues")
+    print(f"🔀 Concurrent dialogues: {MAX_CONCURRENT_DIALOGUES} "
+          f"(API calls at least {REQUEST_INTERVAL:g}s apart)")
     print(f"\n🚀 Running benchmark ({len(dialogues)} dialogues)\n")
 
     results = []
+    pacer = RequestPacer(REQUEST_INTERVAL)
     start = time.time()
 
-    for i, dialogue in enumerate(dialogues, 1):
-        # Progress with ETA
-        elapsed = time.time() - start
-        if i > 1:
-            avg_time_per_dialogue = elapsed / (i - 1)
-            remaining = len(dialogues) - i
-            eta_seconds = remaining * avg_time_per_dialogue
-            eta_minutes = eta_seconds / 60
-            print(f"[{i}/{len(dialogues)}] {dialogue['patient_name']} | ETA: {eta_minutes:.0f}m")
-        else:
-            print(f"[{i}/{len(dialogues)}] {dialogue['patient_name']}")
-
-        results.append(run_dialogue(client, dialogue))
-        print()
-
-        if i % save_checkpoint_every == 0:
-            checkpoint_file = Path("validation/results") / f"checkpoint_{i}_dialogues.json"
-            checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(checkpoint_file, "w", encoding="utf-8") as f:
-                json.dump({
-                    "metadata": {
-                        "model": client.model,
-                        "num_dialogues_completed": i,
-                        "total_dialogues": len(dialogues),
-                        "checkpoint": True,
-                        "timestamp": datetime.now().isoformat(),
-                    },
-                    "results": results
-                }, f, indent=2)
-            print(f"💾 Checkpoint saved: {i}/{len(dialogues)} dialogues completed\n")
+    def run_numbered(i, dialogue):
+        label = f"[{i}/{len(dialogues)}]"
+        print(f"{label} {dialogue['patient_name']}")
+        return run_dialogue(client, dialogue, pacer, label)
+
+    # Dialogues are independent, so several can wait on the API at once;
+    # results still come back (and are checkpointed) in dialogue order
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DIALOGUES) as executor:
+        completed = executor.map(run_numbered, range(1, len(dialogues) + 1), dialogues)
+        try:
+            for i, result in enumerate(completed, 1):
+                results.append(result)
+
+                # Progress with ETA
+                elapsed = time.time() - start
+                remaining = len(dialogues) - i
+                eta_minutes = remaining * (elapsed / i) / 60
+                print(f"✔ {i}/{len(dialogues)} dialogues done | ETA: {eta_minutes:.0f}m\n")
+
+                if i % save_checkpoint_every == 0:
+                    checkpoint_file = Path("validation/results") / f"checkpoint_{i}_dialogues.json"
+                    checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+                    with open(checkpoint_file, "w", encoding="utf-8") as f:
+                        json.dump({
+                            "metadata": {
+                                "model": client.model,
+                                "num_dialogues_completed": i,
+                                "total_dialogues": len(dialogues),
+                                "checkpoint": True,
+                                "timestamp": datetime.now().isoformat(),
+                            },
+                            "results": results
+                        }, f, indent=2)
+                    print(f"💾 Checkpoint saved: {i}/{len(dialogues)} dialogues completed\n")
+        finally:
+            # On an error or Ctrl+C, cancel the dialogues not yet started
+            # (otherwise the executor would run all of them before exiting)
+            completed.close()
 
     elapsed = time.time() - start
 
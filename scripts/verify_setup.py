@@ -48,6 +48,7 @@ def check_files():
         "scripts/run_benchmark.py",
         "scripts/auto_score.py",
         "scripts/create_scoring_sheet.py",
+        "scripts/report_fmt.py",
     ]
 
     all_exist = True
@@ -65,7 +66,8 @@ def check_syntax():
     scripts_to_check = [
         "scripts/run_benchmark.py",
         "scripts/auto_score.py",
-        "scripts/create_scoring_sheet.py"
+        "scripts/create_scoring_sheet.py",
+        "scripts/report_fmt.py"
     ]
 
     all_valid = True